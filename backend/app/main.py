@@ -1,15 +1,26 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from openai import AsyncOpenAI
 
-from .config import ALLOWED_ORIGINS
+from .config import ALLOWED_ORIGINS, OPENAI_API_KEY
 from .routers.transcribe import router as transcribe_router
 from .routers.summarize import router as summarize_router
 from .routers.database import router as database_router
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # shared by every router via services.openai_client.get_openai
+    app.state.openai = AsyncOpenAI(api_key=OPENAI_API_KEY)
+    yield
+    await app.state.openai.close()
+
 app = FastAPI(
     title="Smart Interview Coach",
     description="A FastAPI application  ",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -1,14 +1,22 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
+import hashlib, json
 
 router = APIRouter(tags=["database"])
 
-interview_questions: list[str] = [
+interview_questions: tuple[str, ...] = (
   "Tell me about yourself.",
   "What are your strengths and weaknesses?",
   "Why do you want this job?",
   "Why did you leave your last job?"
-]
+)
+
+# static payload: serialize once and let the browser/CDN revalidate by ETag
+QUESTIONS_JSON = json.dumps(interview_questions).encode("utf-8")
+QUESTIONS_ETAG = '"' + hashlib.blake2b(QUESTIONS_JSON, digest_size=8).hexdigest() + '"'
+QUESTIONS_HEADERS = {"ETag": QUESTIONS_ETAG, "Cache-Control": "public, max-age=86400"}
 
 @router.get("/get-questions", response_model=list[str])
-def getInterviewQuestions() -> list[str]:
-  return interview_questions
\ No newline at end of file
+def getInterviewQuestions(request: Request) -> Response:
+  if request.headers.get("if-none-match") == QUESTIONS_ETAG:
+    return Response(status_code=304, headers=QUESTIONS_HEADERS)
+  return Response(content=QUESTIONS_JSON, media_type="application/json", headers=QUESTIONS_HEADERS)
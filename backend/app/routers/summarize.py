@@ -1,25 +1,30 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 from typing import List
-from openai import OpenAI
-import os, re
+from collections import OrderedDict
+from openai import AsyncOpenAI
+import os, re, json, hashlib
 
 from ..config import OPENAI_API_KEY
+from ..services.openai_client import get_openai
 
 router = APIRouter(tags=["summarize"])
-client = OpenAI(api_key=OPENAI_API_KEY)
 
 # can update later:
 FILLERS = ["um", "uh", "like", "you know", "kinda", "sorta", "actually", "basically", "literally", "i mean", "so"]
 HEDGES  = ["maybe", "perhaps", "sort of", "kind of", "i think", "i guess", "probably", "possibly"]
 
-def count_occurrences(text: str, phrases: List[str]) -> int:
-    t = text.lower()
-    count = 0
-    for p in phrases:
-        pat = r"\b" + re.escape(p) + r"\b" if " " not in p else re.escape(p)
-        count += len(re.findall(pat, t))
-    return count
+def compile_phrases(phrases: List[str]) -> re.Pattern:
+    # one alternation per list so the transcript is scanned once, longest phrase first
+    alts = [r"\b" + re.escape(p) + r"\b" if " " not in p else re.escape(p)
+            for p in sorted(phrases, key=len, reverse=True)]
+    return re.compile("|".join(alts), re.IGNORECASE)
+
+FILLERS_RE = compile_phrases(FILLERS)
+HEDGES_RE  = compile_phrases(HEDGES)
+
+def count_occurrences(text: str, pattern: re.Pattern) -> int:
+    return sum(1 for _ in pattern.finditer(text))
 
 class SummarizeRequest(BaseModel):
     transcript: str = Field(..., min_length=5)
@@ -36,8 +41,15 @@ SYSTEM_PROMPT = (
     "Return ONLY valid JSON with keys: main_points, feedback."
 )
 
+# LRU of recent summaries keyed by transcript hash (frontend retries / dev reruns)
+SUMMARY_CACHE_SIZE = 512
+summary_cache: "OrderedDict[str, SummarizeResponse]" = OrderedDict()
+
+def transcript_key(transcript: str) -> str:
+    return hashlib.blake2b(transcript.encode("utf-8"), digest_size=16).hexdigest()
+
 @router.post("/summarize", response_model=SummarizeResponse)
-def summarize(req: SummarizeRequest):
+async def summarize(req: SummarizeRequest, client: AsyncOpenAI = Depends(get_openai)):
     if not OPENAI_API_KEY:
         raise HTTPException(500, "Missing OPENAI_API_KEY")
 
@@ -45,8 +57,14 @@ def summarize(req: SummarizeRequest):
     if len(transcript) < 5:
         raise HTTPException(400, "Transcript too short.")
 
-    filler_count = count_occurrences(transcript, FILLERS)
-    hedge_count  = count_occurrences(transcript, HEDGES)
+    key = transcript_key(transcript)
+    cached = summary_cache.get(key)
+    if cached is not None:
+        summary_cache.move_to_end(key)
+        return cached
+
+    filler_count = count_occurrences(transcript, FILLERS_RE)
+    hedge_count  = count_occurrences(transcript, HEDGES_RE)
 
     # model returns JSON
     user_prompt = (
@@ -59,9 +77,10 @@ def summarize(req: SummarizeRequest):
     )
 
     try:
-        comp = client.chat.completions.create(
+        comp = await client.chat.completions.create(
             model="gpt-4o-mini",
             temperature=0.2,
+            response_format={"type": "json_object"},
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt},
@@ -71,12 +90,18 @@ def summarize(req: SummarizeRequest):
     except Exception as e:
         raise HTTPException(502, f"LLM error: {e}")
 
-    import json, re as _re
-    json_text = _re.sub(r"^```json|```$", "", raw.strip()).strip()
+    # JSON mode guarantees an object; the guard only covers truncated output
     try:
-        parsed = json.loads(json_text)
-    except Exception:
-        parsed = {"main_points": [json_text], "feedback": []}
+        parsed = json.loads(raw)
+        cacheable = True
+    except (TypeError, json.JSONDecodeError):
+        parsed = {"main_points": [raw or ""], "feedback": []}
+        cacheable = False  # let a retry re-roll an unparseable answer
 
     parsed["metrics"] = {"filler_count": filler_count, "hedge_count": hedge_count}
-    return SummarizeResponse(**parsed)
\ No newline at end of file
+    resp = SummarizeResponse(**parsed)
+    if cacheable:
+        summary_cache[key] = resp
+        if len(summary_cache) > SUMMARY_CACHE_SIZE:
+            summary_cache.popitem(last=False)
+    return resp
\ No newline at end of file
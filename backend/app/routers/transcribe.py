@@ -1,12 +1,11 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
 from fastapi.responses import JSONResponse
-from openai import OpenAI
+from openai import AsyncOpenAI
 from ..config import OPENAI_API_KEY
+from ..services.openai_client import get_openai
 
 router = APIRouter(tags=["transcribe"])
 
-client = OpenAI(api_key=OPENAI_API_KEY)
-
 ALLOWED_TYPES = {
     "audio/webm", "audio/wav", "audio/m4a", "audio/x-m4a",
     "audio/mp3", "audio/mpeg", "audio/mpga",
@@ -14,23 +13,27 @@ ALLOWED_TYPES = {
 }
 
 @router.post("/transcribe")
-async def transcribe(file: UploadFile = File(...), model: str | None = None):
+async def transcribe(
+    file: UploadFile = File(...),
+    model: str | None = None,
+    client: AsyncOpenAI = Depends(get_openai),
+):
     if not OPENAI_API_KEY:
         raise HTTPException(500, "Missing OPENAI_API_KEY. Check your .env or environment.")
 
     if file.content_type not in ALLOWED_TYPES:
         raise HTTPException(400, f"Unsupported content type: {file.content_type}")
 
-    data = await file.read()
-    if len(data) > 25 * 1024 * 1024:
+    # the upload is already spooled to a temp file; size-check it without reading it into memory
+    if file.size is not None and file.size > 25 * 1024 * 1024:
         raise HTTPException(413, "File too large (>25MB). Please compress or shorten the audio.")
 
     use_model = "gpt-4o-mini-transcribe"  # upgrade to gpt-4o-transcribe if needed
 
     try:
-        resp = client.audio.transcriptions.create(
+        resp = await client.audio.transcriptions.create(
             model=use_model,
-            file=(file.filename or "audio", data, file.content_type or "application/octet-stream"),
+            file=(file.filename or "audio", file.file, file.content_type or "application/octet-stream"),
             response_format="text",   # plain transcript string
         )
         transcript = str(resp).strip()
@@ -0,0 +1,7 @@
+from fastapi import Request
+from openai import AsyncOpenAI
+
+
+def get_openai(request: Request) -> AsyncOpenAI:
+    # one client (and connection pool) per process, created in main.lifespan
+    return request.app.state.openai
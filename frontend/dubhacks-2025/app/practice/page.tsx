@@ -165,20 +165,31 @@ const Practice: React.FC = () => {
     const vision = await FilesetResolver.forVisionTasks(
       "https://cdn.jsdelivr.net/npm/@mediapipe/tasks-vision/wasm"
     );
-    faceLandmarkerRef.current = await FaceLandmarker.createFromOptions(vision, {
-      baseOptions: {
-        modelAssetPath:
-          "https://storage.googleapis.com/mediapipe-models/face_landmarker/face_landmarker/float16/1/face_landmarker.task",
-      },
-      runningMode: "VIDEO",
-      numFaces: 1,
-      outputFaceBlendshapes: true,
-      outputFacialTransformationMatrixes: false,
-    });
+    const create = (delegate: "GPU" | "CPU") =>
+      FaceLandmarker.createFromOptions(vision, {
+        baseOptions: {
+          modelAssetPath:
+            "https://storage.googleapis.com/mediapipe-models/face_landmarker/face_landmarker/float16/1/face_landmarker.task",
+          delegate,
+        },
+        runningMode: "VIDEO",
+        numFaces: 1,
+        outputFaceBlendshapes: true,
+        outputFacialTransformationMatrixes: false,
+      });
+
+    // prefer the GPU (WebGL) delegate; fall back to CPU (XNNPACK) if unavailable
+    try {
+      faceLandmarkerRef.current = await create("GPU");
+    } catch (e) {
+      console.warn("GPU delegate unavailable, using CPU", e);
+      faceLandmarkerRef.current = await create("CPU");
+    }
   }
 
   function startFaceLoop() {
     if (!videoRef.current || !canvasRef.current) return;
+    let lastVideoTime = -1;
     const loop = () => {
       const fl = faceLandmarkerRef.current;
       const v = videoRef.current;
@@ -188,6 +199,13 @@ const Practice: React.FC = () => {
         return;
       }
 
+      // rAF runs faster than the camera; skip inference until a new frame arrives
+      if (v.currentTime === lastVideoTime) {
+        rafRef.current = requestAnimationFrame(loop);
+        return;
+      }
+      lastVideoTime = v.currentTime;
+
       const ts = performance.now();
       const res = fl.detectForVideo(v, ts);
       drawOverlay(c, v, res);
@@ -211,7 +229,10 @@ const Practice: React.FC = () => {
           rightOpen: round2(rightOpen),
         });
       } else {
-        setFaceStatus({ emotion: "—", confidence: 0, top3: [], leftOpen: 0, rightOpen: 0 });
+        // no face: keep the previous empty state so React doesn't re-render every frame
+        setFaceStatus((prev) =>
+          prev.emotion === "—" ? prev : { emotion: "—", confidence: 0, top3: [], leftOpen: 0, rightOpen: 0 }
+        );
       }
 
       rafRef.current = requestAnimationFrame(loop);